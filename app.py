@@ -1,34 +1,224 @@
 import os
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
 from datetime import datetime
 import re
-import json
+import orjson
 import pathlib
 import time
-import uuid
 import shutil
+import hashlib
+import html
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from youtube_api import YouTubeAPI
-from utils import parse_duration, format_number, plot_score_components
+from utils import parse_duration_vec, format_number, format_number_vec, format_duration_display, plot_score_components_altair
+
+# Number of video cards rendered per page of the results grid
+VIDEOS_PER_PAGE = 30
+
+# Number of saved searches listed per page in the sidebar
+CACHE_ENTRIES_PER_PAGE = 10
+
+# Playlist ID in the list= parameter of a playlist, watch or youtu.be URL
+PLAYLIST_URL_RE = re.compile(r'youtu(?:\.be/|be\.com/)[^?#]*\?(?:[^#]*&)?list=(?P<list>[\w-]+)')
+
+# How long fetched playlist videos are reused (in memory and on disk), in seconds
+FETCH_CACHE_TTL = 3600
+
+# Append-only metadata index for the cache directory (one JSON record per line),
+# so listing doesn't parse every entry
+CACHE_INDEX_FILE = "index.jsonl"
+
+# Parallel file reads when the index has to be rebuilt from the entry files
+CACHE_SCAN_WORKERS = 4
 
 # Cache Management Functions
+@st.cache_resource
+def get_cache_index_lock():
+    """Lock serializing cache index writes across all sessions of this server
+    
+    app.py is executed as a fresh module on every rerun, so a module-level lock
+    would only be shared within a single run. O_APPEND covers other processes.
+    """
+    return threading.Lock()
+
 def ensure_cache_dir():
     """Ensure the cache directory exists"""
     cache_dir = pathlib.Path("./cache")
     cache_dir.mkdir(exist_ok=True)
     return cache_dir
 
-def save_to_cache(source_type, source_id, raw_videos, ranking_params, label=None):
+def read_cache_index(cache_dir):
+    """Read the cache metadata index
+    
+    Records are replayed in order: an entry record adds or replaces its id,
+    a {"id": ..., "deleted": true} tombstone removes it.
+    
+    Args:
+        cache_dir: Path of the cache directory
+        
+    Returns:
+        Tuple of (list of cache entry metadata, number of records read), or
+        (None, 0) if the index is missing or unreadable
+    """
+    index_file = cache_dir / CACHE_INDEX_FILE
+    
+    if not index_file.exists():
+        return None, 0
+    
+    try:
+        with open(index_file, "rb") as f:
+            lines = f.read().splitlines()
+    except Exception as e:
+        print(f"Error reading cache index {index_file}: {e}")
+        return None, 0
+    
+    entries = {}
+    for line in lines:
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            # A torn write leaves at most one bad line; skip it
+            print(f"Skipping bad record in cache index {index_file}: {e}")
+            continue
+        if record.get("deleted"):
+            entries.pop(record["id"], None)
+        else:
+            entries[record["id"]] = record
+    
+    return list(entries.values()), len(lines)
+
+def write_cache_index(cache_dir, entries):
+    """Atomically replace the cache metadata index with the given entries
+    
+    Args:
+        cache_dir: Path of the cache directory
+        entries: List of cache entry metadata
+    """
+    index_file = cache_dir / CACHE_INDEX_FILE
+    tmp_file = index_file.with_suffix(".tmp")
+    
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(b"".join(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in entries))
+        os.replace(tmp_file, index_file)
+    except Exception as e:
+        print(f"Error writing cache index {index_file}: {e}")
+
+def iter_cache_files(cache_dir):
+    """Yield a DirEntry for each cache entry metadata file
+    
+    scandir yields the name and file type from the directory read itself, so
+    no Path objects or per-file stat calls are needed.
+    
+    Args:
+        cache_dir: Path of the cache directory
+    """
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                yield entry
+
+def read_cache_file_bytes(cache_file):
+    """Read a cache file's raw bytes, or return the exception if it can't be read"""
+    try:
+        with open(cache_file, "rb") as f:
+            return f.read()
+    except Exception as e:
+        return e
+
+def scan_cache_entries(cache_dir, cache_ids=None):
+    """Build cache entry metadata by parsing entry files
+    
+    Only used to (re)build the index when it is missing, or to pick up entry
+    files the index doesn't know about. Entries written before the Parquet
+    split still hold raw_videos inline, which is dropped.
+    
+    Args:
+        cache_dir: Path of the cache directory
+        cache_ids: Optional set of entry IDs to parse; all entry files when None
+        
+    Returns:
+        List of cache entry metadata (without the raw videos)
+    """
+    entries = []
+    errors = []
+    
+    cache_files = [e.path for e in iter_cache_files(cache_dir)
+                   if cache_ids is None or e.name[:-len(".json")] in cache_ids]
+    
+    # Reads run on a small pool (the GIL is released during I/O) while this
+    # thread parses whichever file has already arrived
+    with ThreadPoolExecutor(max_workers=CACHE_SCAN_WORKERS) as executor:
+        for cache_file, data in zip(cache_files, executor.map(read_cache_file_bytes, cache_files)):
+            if isinstance(data, Exception):
+                errors.append(f"{cache_file}: {data}")
+                continue
+            try:
+                entry = orjson.loads(data)
+                # Remove raw videos from metadata to save memory
+                entries.append({k: v for k, v in entry.items() if k != "raw_videos"})
+            except Exception as e:
+                errors.append(f"{cache_file}: {e}")
+    
+    # Report every unreadable file in one message rather than one per file
+    if errors:
+        print(f"Skipped {len(errors)} unreadable cache file(s): " + "; ".join(errors))
+    
+    return entries
+
+def append_cache_index(cache_dir, record):
+    """Append one record (entry metadata or tombstone) to the cache index
+    
+    Callers change the entry files first, so a missing index is rebuilt by
+    scanning and already reflects the change.
+    
+    Args:
+        cache_dir: Path of the cache directory
+        record: Entry metadata, or {"id": ..., "deleted": True} to remove an entry
+    """
+    index_file = cache_dir / CACHE_INDEX_FILE
+    
+    with get_cache_index_lock():
+        if not index_file.exists():
+            write_cache_index(cache_dir, scan_cache_entries(cache_dir))
+            return
+        
+        # A single write() on an O_APPEND descriptor lands whole at the end of the file
+        fd = os.open(index_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        try:
+            os.write(fd, orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        except Exception as e:
+            print(f"Error appending to cache index {index_file}: {e}")
+        finally:
+            os.close(fd)
+
+@st.cache_resource(show_spinner=False)
+def compact_cache_index():
+    """Drop tombstones and replaced records from the cache index, once per server start"""
+    cache_dir = ensure_cache_dir()
+    
+    with get_cache_index_lock():
+        entries, record_count = read_cache_index(cache_dir)
+        if entries is None:
+            entries = scan_cache_entries(cache_dir)
+        elif record_count == len(entries):
+            return
+        write_cache_index(cache_dir, entries)
+
+def save_to_cache(source_type, source_id, raw_videos_df, ranking_params, label=None, videos_key=None):
     """Save the current results to cache
     
     Args:
         source_type: Type of source (channel or playlist)
         source_id: ID of the source
-        raw_videos: List of video data dictionaries
+        raw_videos_df: DataFrame of raw video data, one row per video
         ranking_params: Dictionary of ranking parameters
         label: Optional label for the cache entry
+        videos_key: Optional fingerprint of raw_videos_df, stored so loading
+            the entry doesn't have to hash the videos again
         
     Returns:
         cache_id: ID of the saved cache entry
@@ -36,51 +226,96 @@ def save_to_cache(source_type, source_id, raw_videos, ranking_params, label=None
     cache_dir = ensure_cache_dir()
     
     # Create a unique ID for this cache entry
-    cache_id = str(uuid.uuid4())[:8]
+    cache_id = os.urandom(4).hex()
     
-    # Create cache entry
-    cache_entry = {
+    # Create cache entry metadata
+    entry_meta = {
         "id": cache_id,
         "timestamp": time.time(),
         "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
         "source_type": source_type,
         "source_id": source_id,
         "label": label,
-        "video_count": len(raw_videos),
+        "video_count": len(raw_videos_df),
         "ranking_params": ranking_params,
-        "raw_videos": raw_videos
+        "videos_key": videos_key
     }
     
-    # Save to file
+    # Save the videos as columnar Parquet, then the small metadata file. Each is
+    # written to a temp file and renamed so readers never see a partial file;
+    # no fsync since the cache can always be rebuilt
+    videos_file = cache_dir / f"{cache_id}.videos.parquet"
+    tmp_file = videos_file.with_name(videos_file.name + ".tmp")
+    raw_videos_df.to_parquet(tmp_file, compression="zstd")
+    os.replace(tmp_file, videos_file)
+    
     cache_file = cache_dir / f"{cache_id}.json"
-    with open(cache_file, "w", encoding="utf-8") as f:
-        json.dump(cache_entry, f)
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+    with open(tmp_file, "wb", buffering=0) as f:
+        f.write(orjson.dumps(entry_meta))
+    os.replace(tmp_file, cache_file)
+    
+    # Record the metadata in the index
+    append_cache_index(cache_dir, entry_meta)
     
     return cache_id
 
-def list_cache_entries():
-    """List all available cache entries
+@st.cache_data(show_spinner=False, max_entries=1)
+def list_cache_entries_cached(dir_mtime_ns, index_mtime_ns):
+    """Read and sort the cache entry metadata
+    
+    The arguments are only the cache key: any save, delete or index rewrite
+    changes one of the two mtimes, so reruns reuse the list until then. Only
+    the listing for the current mtimes is ever useful, so just one is kept.
     
+    Args:
+        dir_mtime_ns: Modification time of the cache directory
+        index_mtime_ns: Modification time of the index file (0 if missing)
+        
     Returns:
         List of cache entry metadata (without the raw videos)
     """
     cache_dir = ensure_cache_dir()
-    entries = []
+    entries, _ = read_cache_index(cache_dir)
     
-    for cache_file in cache_dir.glob("*.json"):
-        try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                entry = json.load(f)
-                # Remove raw videos from metadata to save memory
-                entry_meta = {k: v for k, v in entry.items() if k != "raw_videos"}
-                entries.append(entry_meta)
-        except Exception as e:
-            print(f"Error reading cache file {cache_file}: {e}")
+    # First run or migration from an unindexed cache: build the index once
+    if entries is None:
+        with get_cache_index_lock():
+            entries = scan_cache_entries(cache_dir)
+            write_cache_index(cache_dir, entries)
+    else:
+        # Reconcile with entry files added or removed behind the index's back
+        # (copied in, restored from git, deleted by hand); only names are listed
+        # here, and only unknown files get parsed
+        on_disk = {e.name[:-len(".json")] for e in iter_cache_files(cache_dir)}
+        indexed = {entry["id"] for entry in entries}
+        if on_disk != indexed:
+            with get_cache_index_lock():
+                # List and read again under the lock so saves and deletes from
+                # other sessions since the check above aren't lost by the rewrite
+                on_disk = {e.name[:-len(".json")] for e in iter_cache_files(cache_dir)}
+                entries, _ = read_cache_index(cache_dir)
+                entries = [entry for entry in entries or [] if entry["id"] in on_disk]
+                indexed = {entry["id"] for entry in entries}
+                entries += scan_cache_entries(cache_dir, on_disk - indexed)
+                write_cache_index(cache_dir, entries)
     
     # Sort by timestamp, newest first
     entries.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
     return entries
 
+def list_cache_entries():
+    """List all available cache entries
+    
+    Returns:
+        List of cache entry metadata (without the raw videos)
+    """
+    compact_cache_index()
+    cache_dir = ensure_cache_dir()
+    index_file = cache_dir / CACHE_INDEX_FILE
+    index_mtime_ns = index_file.stat().st_mtime_ns if index_file.exists() else 0
+    return list_cache_entries_cached(cache_dir.stat().st_mtime_ns, index_mtime_ns)
+
 def load_cache_entry(cache_id):
     """Load a specific cache entry
     
@@ -88,7 +323,7 @@ def load_cache_entry(cache_id):
         cache_id: ID of the cache entry to load
         
     Returns:
-        Cache entry data or None if not found
+        Cache entry data, with raw_videos as a DataFrame, or None if not found
     """
     cache_dir = ensure_cache_dir()
     cache_file = cache_dir / f"{cache_id}.json"
@@ -97,8 +332,17 @@ def load_cache_entry(cache_id):
         return None
     
     try:
-        with open(cache_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(cache_file, "rb") as f:
+            entry = orjson.loads(f.read())
+        
+        # Entries saved before the Parquet split carry their videos inline
+        if "raw_videos" in entry:
+            entry["raw_videos"] = pd.DataFrame.from_records(entry["raw_videos"])
+        else:
+            videos_file = cache_dir / f"{cache_id}.videos.parquet"
+            # Memory-map so the page cache backs the compressed buffer instead of a heap copy
+            entry["raw_videos"] = pd.read_parquet(videos_file, memory_map=True)
+        return entry
     except Exception as e:
         print(f"Error loading cache file {cache_file}: {e}")
         return None
@@ -120,29 +364,318 @@ def delete_cache_entry(cache_id):
     
     try:
         cache_file.unlink()
-        return True
+        videos_file = cache_dir / f"{cache_id}.videos.parquet"
+        if videos_file.exists():
+            videos_file.unlink()
     except Exception as e:
         print(f"Error deleting cache file {cache_file}: {e}")
         return False
+    
+    append_cache_index(cache_dir, {"id": cache_id, "deleted": True})
+    return True
 
 def clear_all_cache():
     """Delete all cache entries
     
+    Removes the whole cache directory in one rmtree, including the fetched
+    playlist files, and recreates it with an empty index.
+    
     Returns:
         Number of entries deleted
     """
     cache_dir = ensure_cache_dir()
-    count = 0
     
-    for cache_file in cache_dir.glob("*.json"):
+    count = sum(1 for _ in iter_cache_files(cache_dir))
+    
+    with get_cache_index_lock():
         try:
-            cache_file.unlink()
-            count += 1
+            shutil.rmtree(cache_dir)
         except Exception as e:
-            print(f"Error deleting cache file {cache_file}: {e}")
+            print(f"Error deleting cache directory {cache_dir}: {e}")
+        cache_dir.mkdir(exist_ok=True)
+        write_cache_index(cache_dir, [])
     
     return count
 
+# Cached data pipeline
+def hash_api_key(api_key):
+    """Return a short digest of the API key to salt cache keys without storing the key itself"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:8]
+
+def videos_fingerprint(raw_videos_df):
+    """Return a content hash identifying a DataFrame of raw videos"""
+    digest = hashlib.sha256(orjson.dumps(list(raw_videos_df.columns)))
+    digest.update(pd.util.hash_pandas_object(raw_videos_df, index=False).values.tobytes())
+    return digest.hexdigest()[:16]
+
+def get_youtube_api(api_key):
+    """Return this session's YouTubeAPI client for the key
+    
+    Reusing the client across reruns avoids rebuilding the discovery resource
+    on every button click and keeps its response caches warm. It lives in
+    session state rather than st.cache_resource: its httplib2 connection isn't
+    thread-safe, and its call counter must only count this session's requests.
+    """
+    key_hash = hash_api_key(api_key)
+    cached = st.session_state.get("youtube_api")
+    if cached is None or cached[0] != key_hash:
+        # Imported here so googleapiclient only loads once a client is actually needed
+        from youtube_api import YouTubeAPI
+        cached = (key_hash, YouTubeAPI(api_key))
+        st.session_state.youtube_api = cached
+    return cached[1]
+
+@st.cache_resource
+def get_fetched_playlists():
+    """In-memory store of fetched playlists shared by all sessions
+    
+    Maps (playlist_id, api_key_hash) to (fetch time, DataFrame). Used instead
+    of st.cache_data because the fetch drives progress elements created outside
+    it, which cache_data can't replay on a hit.
+    """
+    return {}
+
+def fetch_playlist_videos(playlist_id, api_key_hash, api, progress_callback=None):
+    """Fetch all videos of a playlist, cached per playlist and API key
+    
+    Results are kept in memory for FETCH_CACHE_TTL and also persisted to
+    ./cache/fetched/<playlist_id>.parquet so that a server restart within
+    FETCH_CACHE_TTL does not cost another API walk.
+    
+    Args:
+        playlist_id: ID of the playlist to fetch
+        api_key_hash: Digest of the API key, used only as part of the cache key
+        api: YouTubeAPI instance used on a cache miss
+        progress_callback: Optional progress callback, only called on a cache miss
+        
+    Returns:
+        DataFrame of video data, one row per video; shared between sessions,
+        so callers must not modify it
+    """
+    fetched = get_fetched_playlists()
+    memo_key = (playlist_id, api_key_hash)
+    now = time.time()
+    
+    cached = fetched.get(memo_key)
+    if cached is not None and now - cached[0] < FETCH_CACHE_TTL:
+        return cached[1]
+    
+    # Only use the disk cache for IDs that are safe to use as file names
+    fetch_cache_file = None
+    if re.fullmatch(r"[\w-]+", playlist_id):
+        fetch_cache_file = ensure_cache_dir() / "fetched" / f"{playlist_id}.parquet"
+        if fetch_cache_file.exists():
+            fetch_time = fetch_cache_file.stat().st_mtime
+            if now - fetch_time < FETCH_CACHE_TTL:
+                try:
+                    videos = pd.read_parquet(fetch_cache_file, memory_map=True)
+                    fetched[memo_key] = (fetch_time, videos)
+                    return videos
+                except Exception as e:
+                    # Unreadable file: drop it and fall through to the API
+                    print(f"Error reading fetch cache file {fetch_cache_file}: {e}")
+                    fetch_cache_file.unlink(missing_ok=True)
+    
+    videos = pd.DataFrame.from_records(api.get_videos_from_playlist(playlist_id, progress_callback=progress_callback))
+    
+    # Drop expired playlists so the store doesn't grow for the life of the server
+    for key in [key for key, (fetch_time, _) in fetched.items() if now - fetch_time >= FETCH_CACHE_TTL]:
+        fetched.pop(key, None)
+    fetched[memo_key] = (time.time(), videos)
+    
+    if fetch_cache_file is not None:
+        # Write to a uniquely named temp file and rename, so a crash or another
+        # session fetching the same playlist never leaves a torn file behind
+        tmp_file = fetch_cache_file.with_name(f"{fetch_cache_file.name}.{os.urandom(4).hex()}.tmp")
+        try:
+            fetch_cache_file.parent.mkdir(exist_ok=True)
+            videos.to_parquet(tmp_file, compression="zstd")
+            os.replace(tmp_file, fetch_cache_file)
+        except Exception as e:
+            print(f"Error writing fetch cache file {fetch_cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
+    
+    return videos
+
+# Each distinct (videos, weights) combination keeps a scored frame in memory;
+# bound how many slider positions are remembered
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def score_videos(videos_key, like_weight, view_weight, half_life_days, _raw_videos_df):
+    """Score videos, cached per video set and ranking parameters
+    
+    Args:
+        videos_key: Fingerprint of the raw videos (see videos_fingerprint)
+        like_weight: Weight for likes in the score calculation
+        view_weight: Weight for views in the score calculation
+        half_life_days: Number of days after which a video's score is halved
+        _raw_videos_df: DataFrame of raw video data (not hashed)
+        
+    Returns:
+        Tuple of (DataFrame with videos and their scores, dict of aggregate stats
+        and filter bounds)
+    """
+    from youtube_api import calculate_video_scores
+    df = calculate_video_scores(
+        _raw_videos_df,
+        like_weight=like_weight,
+        view_weight=view_weight,
+        half_life_days=half_life_days
+    )
+    
+    if not df.empty:
+        # Arrow-backed titles let title search run on PyArrow compute kernels;
+        # the lowercased copy is built once so searches only need to scan it
+        df["title"] = df["title"].astype("string[pyarrow]")
+        df["title_lower"] = df["title"].str.lower()
+        
+        # Precompute display columns once per scoring instead of on every rerun
+        df["duration_str"], df["duration_seconds"] = parse_duration_vec(df["duration"])
+        df["view_count_str"] = format_number_vec(df["view_count"])
+        df["like_count_str"] = format_number_vec(df["like_count"])
+        df["published_at_str"] = df["published_at"].dt.strftime("%Y-%m-%d")
+        # Days since the Unix epoch (UTC) for cheap integer date-range filtering
+        df["pub_day"] = df["published_at"].values.astype("datetime64[D]").astype("int32")
+        df["score_str"] = df["score"].map("{:.2f}".format)
+        
+        # Downcast to compact dtypes; counts get the smallest unsigned type that fits
+        for column in ("view_count", "like_count", "comment_count"):
+            df[column] = pd.to_numeric(df[column], downcast="unsigned")
+        # Score components only feed the chart and sorting; float32 precision is plenty
+        float_columns = df.select_dtypes("float64").columns
+        df[float_columns] = df[float_columns].astype("float32")
+        df["published_at"] = df["published_at"].dt.as_unit("s")
+        
+        # Card HTML for the results grid, built once here so rendering is just a join;
+        # API-provided text is escaped since the grid is emitted with unsafe_allow_html
+        df["card_html"] = (
+            '<div class="video-card">'
+            '<a href="' + df["url"].map(html.escape) + '" target="_blank">'
+            '<img src="' + df["thumbnail"].map(html.escape) + '" width="100%" '
+            'loading="lazy" decoding="async" referrerpolicy="no-referrer">'
+            '</a>'
+            '<div class="video-title">' + df["title"].map(html.escape) + '</div>'
+            '<div class="video-stats">'
+            '👁️ ' + df["view_count_str"] + ' views &nbsp;|&nbsp; '
+            '👍 ' + df["like_count_str"] + ' likes &nbsp;|&nbsp; '
+            '⏱️ ' + df["duration_str"] +
+            '</div>'
+            '<div class="video-stats">'
+            '📅 ' + df["published_at_str"] + ' &nbsp;|&nbsp; '
+            '<span class="video-score">Score: ' + df["score_str"] + '</span>'
+            '</div>'
+            '</div>'
+        ).astype("string[pyarrow]")
+        
+        # Remaining text columns move to Arrow storage as well: one contiguous buffer
+        # per column instead of a Python object per cell
+        text_columns = ["id", "duration_str", "view_count_str",
+                        "like_count_str", "published_at_str", "score_str"]
+        df[text_columns] = df[text_columns].astype("string[pyarrow]")
+        
+        # The ISO duration is fully represented by duration_str and duration_seconds,
+        # and url/thumbnail only live on inside card_html; description is never
+        # shown. The raw frame keeps all of them for the cache. Copying once
+        # consolidates the columns added above into contiguous blocks
+        df = df.drop(columns=["duration", "description", "url", "thumbnail"]).copy()
+    
+    # Aggregates shown in the header metrics, computed once alongside the frame
+    stats = {
+        "total_views": int(df["view_count"].sum()) if not df.empty else 0,
+        "total_likes": int(df["like_count"].sum()) if not df.empty else 0
+    }
+    
+    # Full-range bounds for the filter widgets, so reruns don't rescan these columns
+    if not df.empty:
+        stats["date_range"] = (df["published_at"].min().date(), df["published_at"].max().date())
+        stats["duration_range"] = (int(df["duration_seconds"].min()), int(df["duration_seconds"].max()))
+        stats["views_range"] = (int(df["view_count"].min()), int(df["view_count"].max()))
+        stats["likes_range"] = (int(df["like_count"].min()), int(df["like_count"].max()))
+    
+    return df, stats
+
+def frame_fingerprint(df):
+    """Return a hash of the columns the score chart plots, used as the DataFrame's cache hash"""
+    return pd.util.hash_pandas_object(df[["score", "time_decay_factor"]], index=False).values.tobytes()
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
+def score_components_chart(df):
+    """Build the score components chart, cached per scored DataFrame"""
+    return plot_score_components_altair(df)
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def filter_indices(scores_key, date_range, duration_range, views_range, likes_range, search_term,
+                   _df, _bounds):
+    """Apply the video filters to a scored DataFrame, cached across sessions
+    
+    Only the small index array is cached, so identical filter selections on the
+    same scored videos are answered from memory for every user.
+    
+    Args:
+        scores_key: Tuple of (videos fingerprint, like weight, view weight, half-life)
+            identifying the scored DataFrame
+        date_range: Tuple of (start date, end date)
+        duration_range: Tuple of (min, max) duration in seconds
+        views_range: Tuple of (min, max) view count
+        likes_range: Tuple of (min, max) like count
+        search_term: Case-insensitive substring to look for in titles
+        _df: Scored DataFrame from score_videos (not hashed)
+        _bounds: Stats dict from score_videos, holding each filter's full range (not hashed)
+        
+    Returns:
+        Sorted int32 array of matching row positions, or None if no filter narrows the frame
+    """
+    # Skip masking entirely when every filter is at its full range
+    filters_active = (
+        bool(search_term)
+        or tuple(date_range) != _bounds["date_range"]
+        or tuple(duration_range) != _bounds["duration_range"]
+        or tuple(views_range) != _bounds["views_range"]
+        or tuple(likes_range) != _bounds["likes_range"]
+    )
+    if not filters_active:
+        return None
+    
+    # Apply all filters as one composite boolean mask
+    mask = np.ones(len(_df), dtype=bool)
+    
+    # Date filter (integer comparison on the precomputed epoch-day column)
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        pub_day = _df["pub_day"].values
+        mask &= (pub_day >= np.datetime64(start_date, "D").astype(np.int64)) & \
+                (pub_day <= np.datetime64(end_date, "D").astype(np.int64))
+    
+    # Duration filter
+    if duration_range:
+        min_duration, max_duration = duration_range
+        duration_seconds = _df["duration_seconds"].values
+        mask &= (duration_seconds >= min_duration) & (duration_seconds <= max_duration)
+    
+    # Views filter
+    if views_range:
+        min_views, max_views = views_range
+        view_count = _df["view_count"].values
+        mask &= (view_count >= min_views) & (view_count <= max_views)
+    
+    # Likes filter
+    if likes_range:
+        min_likes, max_likes = likes_range
+        like_count = _df["like_count"].values
+        mask &= (like_count >= min_likes) & (like_count <= max_likes)
+    
+    # Title search
+    if search_term:
+        # Arrow-backed contains returns a nullable BooleanArray; take a plain bool ndarray
+        mask &= _df["title_lower"].str.contains(search_term.lower(), regex=False, na=False).to_numpy(dtype=bool)
+    
+    return np.flatnonzero(mask).astype(np.int32)
+
+@st.cache_resource
+def load_css():
+    """Read the app stylesheet once per process and wrap it in a style tag"""
+    css_file = pathlib.Path(__file__).parent / "static" / "style.css"
+    return f"<style>\n{css_file.read_text(encoding='utf-8')}</style>"
+
 # Set page config
 st.set_page_config(
     page_title="YouTube Smart Sorter",
@@ -151,109 +684,49 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Add custom CSS
-st.markdown("""
-<style>
-    .video-card {
-        border: 1px solid #ddd;
-        border-radius: 10px;
-        padding: 10px;
-        margin-bottom: 10px;
-        background-color: #f9f9f9;
-    }
-    .video-title {
-        font-weight: bold;
-        font-size: 16px;
-        margin-bottom: 5px;
-    }
-    .video-stats {
-        font-size: 14px;
-        color: #555;
-    }
-    .video-score {
-        font-weight: bold;
-        color: #1e88e5;
-    }
-    .or-divider {
-        text-align: center;
-        margin: 10px 0;
-        font-weight: bold;
-    }
-    .api-counter {
-        background-color: #f0f0f0;
-        padding: 10px;
-        border-radius: 5px;
-        margin-top: 10px;
-        border-left: 3px solid #1e88e5;
-    }
-    .warning-message {
-        background-color: #fff3cd;
-        padding: 10px;
-        border-radius: 5px;
-        margin: 10px 0;
-        border-left: 3px solid #ffc107;
-    }
-    .filter-section {
-        background-color: #f8f9fa;
-        padding: 15px;
-        border-radius: 10px;
-        margin-bottom: 20px;
-    }
-    .filter-header {
-        font-weight: bold;
-        margin-bottom: 10px;
-    }
-    .stExpander {
-        border: none !important;
-        box-shadow: none !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Add custom CSS (Streamlit drops elements that aren't emitted, so this runs every rerun)
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Main application window layout
 st.title("YouTube Smart Sorter")
 
-# Initialize session state for important variables
-if "source_type" not in st.session_state:
-    st.session_state.source_type = "channel"
-if "api_key" not in st.session_state:
-    st.session_state.api_key = os.getenv("YOUTUBE_API_KEY", "")
-if "videos_df" not in st.session_state:
-    st.session_state.videos_df = None
-if "channel_id" not in st.session_state:
-    st.session_state.channel_id = ""
-if "playlist_id" not in st.session_state:
-    st.session_state.playlist_id = ""
-if "raw_videos" not in st.session_state:
-    st.session_state.raw_videos = []
-if "show_confirmation" not in st.session_state:
-    st.session_state.show_confirmation = False
-if "run_fetch" not in st.session_state:
-    st.session_state.run_fetch = False
-if "last_channel_input" not in st.session_state:
-    st.session_state.last_channel_input = ""
-if "last_playlist_input" not in st.session_state:
-    st.session_state.last_playlist_input = ""
-if "api_call_count" not in st.session_state:
-    st.session_state.api_call_count = 0
-if "total_api_call_count" not in st.session_state:
-    st.session_state.total_api_call_count = 0
-if "estimate_info" not in st.session_state:
-    st.session_state.estimate_info = None
-if "cache_entries" not in st.session_state:
-    st.session_state.cache_entries = []
-if "selected_cache_id" not in st.session_state:
-    st.session_state.selected_cache_id = None
-if "cache_loaded" not in st.session_state:
-    st.session_state.cache_loaded = False
-if "like_weight" not in st.session_state:
-    st.session_state.like_weight = 1.0
-if "view_weight" not in st.session_state:
-    st.session_state.view_weight = 0.1
-if "half_life_days" not in st.session_state:
-    st.session_state.half_life_days = 90
-if "channel_search_results" not in st.session_state:
-    st.session_state.channel_search_results = []
+# Initialize session state for important variables. Built on each rerun so
+# every session gets its own lists and dicts
+session_defaults = {
+    "source_type": "channel",
+    "api_key": os.getenv("YOUTUBE_API_KEY", ""),
+    "videos_df": None,
+    "video_stats": None,
+    "channel_id": "",
+    "playlist_id": "",
+    "raw_videos_df": None,
+    "videos_key": None,
+    "show_confirmation": False,
+    "run_estimation": False,
+    "run_fetch": False,
+    "last_channel_input": "",
+    "last_playlist_input": "",
+    "api_call_count": 0,
+    "total_api_call_count": 0,
+    "estimate_info": None,
+    "cache_entries": [],
+    "selected_cache_id": None,
+    "cache_loaded": False,
+    "like_weight": 1.0,
+    "view_weight": 0.1,
+    "half_life_days": 90,
+    "channel_search_results": [],
+    "cache_page": 1,
+    # Results pagination and filtering: 1-based page, the filters they belong
+    # to, and the matching row positions
+    "results_page": 1,
+    "results_filter_key": None,
+    "results_indices": None,
+    # Bumped to recreate the filter widgets at their defaults (see reset_filters)
+    "filter_generation": 0
+}
+for key, value in session_defaults.items():
+    st.session_state.setdefault(key, value)
 
 # Define callback functions for buttons to ensure proper state management
 def estimate_api_calls():
@@ -265,12 +738,31 @@ def confirm_fetch():
     """Callback function for the Proceed with Fetch button"""
     st.session_state.run_fetch = True
 
+def reset_filters():
+    """Callback function for the Reset All Filters button
+    
+    The filter widget keys include a generation number, so bumping it creates
+    fresh widgets at their full bounds and discards edits that were never
+    applied too. Also used whenever a new set of videos is scored.
+    """
+    st.session_state.filter_generation += 1
+
+def change_results_page(delta):
+    """Callback function for the Previous/Next page buttons"""
+    st.session_state.results_page += delta
+
+def change_cache_page(delta):
+    """Callback function for the saved results Previous/Next page buttons"""
+    st.session_state.cache_page += delta
+
 def load_from_cache(cache_id):
     """Callback function for loading data from cache"""
     cache_entry = load_cache_entry(cache_id)
     if cache_entry:
         # Load the data from cache
-        st.session_state.raw_videos = cache_entry["raw_videos"]
+        st.session_state.raw_videos_df = cache_entry["raw_videos"]
+        # Entries saved before the fingerprint was stored get hashed here
+        st.session_state.videos_key = cache_entry.get("videos_key") or videos_fingerprint(cache_entry["raw_videos"])
         
         # Set the ranking parameters
         params = cache_entry["ranking_params"]
@@ -279,12 +771,12 @@ def load_from_cache(cache_id):
         st.session_state.half_life_days = params["half_life_days"]
         
         # Recalculate scores with the original parameters
-        from youtube_api import calculate_video_scores
-        st.session_state.videos_df = calculate_video_scores(
-            st.session_state.raw_videos,
-            like_weight=params["like_weight"],
-            view_weight=params["view_weight"],
-            half_life_days=params["half_life_days"]
+        st.session_state.videos_df, st.session_state.video_stats = score_videos(
+            st.session_state.videos_key,
+            params["like_weight"],
+            params["view_weight"],
+            params["half_life_days"],
+            st.session_state.raw_videos_df
         )
         
         # Set source info
@@ -300,14 +792,8 @@ def load_from_cache(cache_id):
         st.session_state.cache_loaded = True
         st.session_state.selected_cache_id = cache_id
         
-        # Reset filter settings
-        st.session_state.filter_settings = {
-            "date_range": None,
-            "duration_range": None,
-            "views_range": None,
-            "likes_range": None,
-            "search_term": ""
-        }
+        # Reset filter settings to the new videos' bounds
+        reset_filters()
         
         # No API calls were made
         st.session_state.api_call_count = 0
@@ -315,7 +801,7 @@ def load_from_cache(cache_id):
 # Function to recalculate scores without refetching data
 def recalculate_scores():
     """Recalculate video scores using current parameter settings"""
-    if st.session_state.raw_videos is None:
+    if st.session_state.raw_videos_df is None:
         return
     
     # Get parameters from session state
@@ -323,45 +809,28 @@ def recalculate_scores():
     view_weight = st.session_state.get('view_weight', 0.1)
     half_life_days = st.session_state.get('half_life_days', 90)
     
-    # Use the standalone function instead of creating a YouTubeAPI instance
-    from youtube_api import calculate_video_scores
-    
-    # Recalculate scores
-    st.session_state.videos_df = calculate_video_scores(
-        st.session_state.raw_videos,
-        like_weight=like_weight,
-        view_weight=view_weight,
-        half_life_days=half_life_days
+    # Recalculate scores (served from cache when these parameters were used before)
+    st.session_state.videos_df, st.session_state.video_stats = score_videos(
+        st.session_state.videos_key,
+        like_weight,
+        view_weight,
+        half_life_days,
+        st.session_state.raw_videos_df
     )
 
-# Helper function to convert duration string to seconds
-def duration_to_seconds(duration_str):
-    """Convert a duration string like '1:23' or '1:23:45' to seconds"""
-    parts = duration_str.split(':')
-    if len(parts) == 2:  # MM:SS format
-        return int(parts[0]) * 60 + int(parts[1])
-    elif len(parts) == 3:  # HH:MM:SS format
-        return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-    return 0
-
-# Initialize additional state for button callbacks
-if "run_estimation" not in st.session_state:
-    st.session_state.run_estimation = False
-if "run_fetch" not in st.session_state:
-    st.session_state.run_fetch = False
-
-# Initialize filter states
-if "filter_settings" not in st.session_state:
-    st.session_state.filter_settings = {
-        "date_range": None,
-        "duration_range": None,
-        "views_range": None,
-        "likes_range": None,
-        "search_term": ""
-    }
+def apply_sidebar_ranking():
+    """Callback for the sidebar ranking form: commit its parameters and rescore"""
+    st.session_state.like_weight = st.session_state.sidebar_like_weight
+    st.session_state.view_weight = st.session_state.sidebar_view_weight
+    st.session_state.half_life_days = st.session_state.sidebar_half_life_days
+    recalculate_scores()
 
 # Sidebar
 with st.sidebar:
+    # Session state is read and written dozens of times per rerun in here;
+    # bind the proxy once rather than resolving st.session_state each time
+    ss = st.session_state
+    
     st.title("YouTube Smart Sorter")
     st.markdown("Find the best videos from a YouTube channel or playlist using a smart ranking algorithm.")
     
@@ -369,13 +838,28 @@ with st.sidebar:
     st.subheader("Saved Results")
     
     # Get cache entries and update session state
-    st.session_state.cache_entries = list_cache_entries()
+    ss.cache_entries = list_cache_entries()
     
-    if st.session_state.cache_entries:
-        st.write(f"Found {len(st.session_state.cache_entries)} saved searches")
+    if ss.cache_entries:
+        st.write(f"Found {len(ss.cache_entries)} saved searches")
+        
+        # Only render the current page of entries; clamp after deletes shrink the list
+        cache_page_count = max(1, (len(ss.cache_entries) + CACHE_ENTRIES_PER_PAGE - 1) // CACHE_ENTRIES_PER_PAGE)
+        cache_page = min(max(ss.cache_page, 1), cache_page_count)
+        ss.cache_page = cache_page
+        
+        if cache_page_count > 1:
+            cache_page_cols = st.columns([1, 2, 1])
+            with cache_page_cols[0]:
+                st.button("◀", key="cache_prev", on_click=change_cache_page, args=(-1,), disabled=cache_page <= 1)
+            with cache_page_cols[1]:
+                st.write(f"Page {cache_page} of {cache_page_count}")
+            with cache_page_cols[2]:
+                st.button("▶", key="cache_next", on_click=change_cache_page, args=(1,), disabled=cache_page >= cache_page_count)
         
         # Display cache entries
-        for entry in st.session_state.cache_entries:
+        page_start = (cache_page - 1) * CACHE_ENTRIES_PER_PAGE
+        for entry in ss.cache_entries[page_start:page_start + CACHE_ENTRIES_PER_PAGE]:
             # Create entry title with label if available
             if entry.get('label'):
                 entry_title = f"{entry['label']} ({entry['date']})"
@@ -392,22 +876,23 @@ with st.sidebar:
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button("Load", key=f"load_{entry['id']}"):
-                        load_from_cache(entry['id'])
+                        with st.spinner("Loading and scoring cached videos..."):
+                            load_from_cache(entry['id'])
                         st.success("Loaded from cache!")
                         st.rerun()
                 
                 with col2:
                     if st.button("Delete", key=f"delete_{entry['id']}"):
                         if delete_cache_entry(entry['id']):
-                            if st.session_state.selected_cache_id == entry['id']:
-                                st.session_state.selected_cache_id = None
+                            if ss.selected_cache_id == entry['id']:
+                                ss.selected_cache_id = None
                             st.success("Deleted!")
                             st.rerun()
         
         # Add button to clear all cache
         if st.button("Clear All Cache"):
             count = clear_all_cache()
-            st.session_state.selected_cache_id = None
+            ss.selected_cache_id = None
             st.success(f"Deleted {count} cache entries!")
             st.rerun()
     else:
@@ -415,19 +900,19 @@ with st.sidebar:
     
     # API Key input
     st.subheader("API Settings")
-    api_key = st.text_input("YouTube API Key", value=st.session_state.api_key, type="password")
+    api_key = st.text_input("YouTube API Key", value=ss.api_key, type="password")
     
     # Input selection
     st.subheader("Video Source")
-    source_type = st.radio("Select Source Type", ["Channel", "Playlist", "Search Channels"], index=0 if st.session_state.source_type == "channel" else (1 if st.session_state.source_type == "playlist" else 2))
-    st.session_state.source_type = source_type.lower().replace(" ", "_")
+    source_type = st.radio("Select Source Type", ["Channel", "Playlist", "Search Channels"], index=0 if ss.source_type == "channel" else (1 if ss.source_type == "playlist" else 2))
+    ss.source_type = source_type.lower().replace(" ", "_")
 
-    if st.session_state.source_type == "channel":
+    if ss.source_type == "channel":
         # Channel input
         channel_input = st.text_input("YouTube Channel Username or URL")
         playlist_input = ""  # Reset playlist input
         search_query = ""    # Reset search query
-    elif st.session_state.source_type == "playlist":
+    elif ss.source_type == "playlist":
         # Playlist input
         playlist_input = st.text_input("YouTube Playlist ID or URL")
         channel_input = ""  # Reset channel input
@@ -440,32 +925,32 @@ with st.sidebar:
         
         # Add search button and logic for channel search
         if search_query and st.button("Search Channels"):
-            st.session_state.api_key = api_key
+            ss.api_key = api_key
             
             with st.spinner("Searching for channels..."):
                 try:
                     # Initialize API
-                    youtube_api = YouTubeAPI(api_key)
+                    youtube_api = get_youtube_api(api_key)
                     
                     # Special channel search function to find multiple channels
                     search_results = youtube_api.search_channels(search_query, max_results=10)
                     
                     if search_results:
-                        st.session_state.channel_search_results = search_results
+                        ss.channel_search_results = search_results
                         st.success(f"Found {len(search_results)} channels!")
                     else:
                         st.error("No channels found. Try a different search term.")
-                        st.session_state.channel_search_results = []
+                        ss.channel_search_results = []
                 except Exception as e:
                     st.error(f"Error searching for channels: {str(e)}")
-                    st.session_state.channel_search_results = []
+                    ss.channel_search_results = []
         
         # Display search results if available
-        if "channel_search_results" in st.session_state and st.session_state.channel_search_results:
+        if "channel_search_results" in ss and ss.channel_search_results:
             st.subheader("Select a Channel to Rate Videos")
             
             # Create columns for better display
-            for i, channel in enumerate(st.session_state.channel_search_results):
+            for i, channel in enumerate(ss.channel_search_results):
                 col1, col2 = st.columns([1, 3])
                 
                 with col1:
@@ -482,11 +967,11 @@ with st.sidebar:
                     # Add Rate Videos button without nested columns
                     if st.button(f"Rate Videos", key=f"select_channel_{i}"):
                         # Set the selected channel as the current channel
-                        st.session_state.source_type = "channel"
-                        st.session_state.channel_id = channel["id"]
-                        st.session_state.last_channel_input = channel["id"]
-                        st.session_state.show_confirmation = True
-                        st.session_state.estimate_info = {
+                        ss.source_type = "channel"
+                        ss.channel_id = channel["id"]
+                        ss.last_channel_input = channel["id"]
+                        ss.show_confirmation = True
+                        ss.estimate_info = {
                             "type": "channel_alternative",
                             "input": channel["title"],
                             "estimated_calls": channel.get("estimated_calls", 10),
@@ -503,20 +988,17 @@ with st.sidebar:
                 st.markdown("---")
     
     # Extract playlist ID from URL if needed
-    if playlist_input and "youtube.com/playlist" in playlist_input:
-        import urllib.parse as urlparse
-        from urllib.parse import parse_qs
-        
-        parsed_url = urlparse.urlparse(playlist_input)
-        playlist_id_from_url = parse_qs(parsed_url.query).get('list', [None])[0]
-        if playlist_id_from_url:
-            playlist_input = playlist_id_from_url
+    playlist_url_match = PLAYLIST_URL_RE.search(playlist_input) if playlist_input else None
+    if playlist_url_match:
+        playlist_input = playlist_url_match.group("list")
     
-    # Algorithm parameters
+    # Algorithm parameters; in a form so dragging a slider doesn't rerun the app
     st.subheader("Ranking Parameters")
-    like_weight = st.slider("Like Weight", 0.1, 5.0, 1.0, 0.1)
-    view_weight = st.slider("View Weight", 0.01, 1.0, 0.1, 0.01)
-    half_life_days = st.slider("Half-life (days)", 7, 365, 90, 1)
+    with st.form(key="sidebar_ranking_form"):
+        like_weight = st.slider("Like Weight", 0.1, 5.0, 1.0, 0.1, key="sidebar_like_weight")
+        view_weight = st.slider("View Weight", 0.01, 1.0, 0.1, 0.01, key="sidebar_view_weight")
+        half_life_days = st.slider("Half-life (days)", 7, 365, 90, 1, key="sidebar_half_life_days")
+        st.form_submit_button("Apply", on_click=apply_sidebar_ranking)
     
     # Add option for exact matching
     st.subheader("Advanced Options")
@@ -524,29 +1006,29 @@ with st.sidebar:
                                        help="When disabled (recommended), only exact channel name matches will be returned. Enable only if you're having trouble finding a channel.")
     
     # Reset confirmation if input changes
-    if (st.session_state.source_type == "channel" and 
-        channel_input != st.session_state.last_channel_input) or \
-       (st.session_state.source_type == "playlist" and 
-        playlist_input != st.session_state.last_playlist_input):
-        st.session_state.show_confirmation = False
-        st.session_state.estimate_info = None
+    if (ss.source_type == "channel" and 
+        channel_input != ss.last_channel_input) or \
+       (ss.source_type == "playlist" and 
+        playlist_input != ss.last_playlist_input):
+        ss.show_confirmation = False
+        ss.estimate_info = None
     
     # Buttons with callback functions to ensure proper state management
     st.button("Estimate API Calls", on_click=estimate_api_calls, disabled=not (api_key and (channel_input or playlist_input)))
     
     # Process estimation request
-    if st.session_state.run_estimation and api_key and (channel_input or playlist_input):
+    if ss.run_estimation and api_key and (channel_input or playlist_input):
         # Reset the flag
-        st.session_state.run_estimation = False
-        st.session_state.api_key = api_key
+        ss.run_estimation = False
+        ss.api_key = api_key
         
         with st.spinner("Estimating required API calls..."):
             try:
                 # Initialize API
-                youtube_api = YouTubeAPI(api_key)
+                youtube_api = get_youtube_api(api_key)
                 
                 # Handle channel input
-                if st.session_state.source_type == "channel" and channel_input:
+                if ss.source_type == "channel" and channel_input:
                     try:
                         # First get the channel ID, then convert to modified playlist ID
                         modified_id = youtube_api.get_modified_playlist_id_from_channel(channel_input, allow_partial_matches=allow_partial_matches)
@@ -554,7 +1036,7 @@ with st.sidebar:
                         estimate_info = youtube_api.estimate_playlist_api_calls(modified_id)
                         
                         if "error" not in estimate_info:
-                            st.session_state.estimate_info = {
+                            ss.estimate_info = {
                                 "type": "channel_alternative",
                                 "input": channel_input,
                                 "estimated_calls": estimate_info["estimated_calls"],
@@ -563,17 +1045,17 @@ with st.sidebar:
                             }
                         else:
                             st.error(f"Error estimating API calls: {estimate_info['error']}")
-                            st.session_state.estimate_info = None
+                            ss.estimate_info = None
                     except Exception as e:
                         st.error(f"Error estimating API calls: {str(e)}")
-                        st.session_state.estimate_info = None
+                        ss.estimate_info = None
                 
                 # Handle playlist input
-                elif st.session_state.source_type == "playlist" and playlist_input:
+                elif ss.source_type == "playlist" and playlist_input:
                     estimate_info = youtube_api.estimate_playlist_api_calls(playlist_input)
                     
                     if "error" not in estimate_info:
-                        st.session_state.estimate_info = {
+                        ss.estimate_info = {
                             "type": "playlist",
                             "input": playlist_input,
                             "estimated_calls": estimate_info["estimated_calls"],
@@ -582,22 +1064,22 @@ with st.sidebar:
                         }
                     else:
                         st.error(f"Error estimating API calls: {estimate_info['error']}")
-                        st.session_state.estimate_info = None
+                        ss.estimate_info = None
                 
                 else:
                     st.error("Please enter either a channel or playlist identifier.")
                 
                 # Set the flag to show confirmation
-                if st.session_state.estimate_info:
-                    st.session_state.show_confirmation = True
+                if ss.estimate_info:
+                    ss.show_confirmation = True
                 
             except Exception as e:
                 st.error(f"Error: {str(e)}")
-                st.session_state.estimate_info = None
+                ss.estimate_info = None
     
     # Show estimate results and confirmation
-    if st.session_state.show_confirmation and st.session_state.estimate_info:
-        estimate = st.session_state.estimate_info
+    if ss.show_confirmation and ss.estimate_info:
+        estimate = ss.estimate_info
         
         # Display estimate info
         if estimate["already_cached"]:
@@ -621,24 +1103,25 @@ with st.sidebar:
         st.button("Proceed with Fetch", on_click=confirm_fetch)
     
     # Fetch button logic - now uses callback system for reliable execution
-    if st.session_state.run_fetch and api_key and (channel_input or playlist_input):
+    if ss.run_fetch and api_key and (channel_input or playlist_input):
         # Reset the flag so it doesn't run again
-        st.session_state.run_fetch = False
+        ss.run_fetch = False
         
         # Reset API call counter for this run
-        st.session_state.api_call_count = 0
+        ss.api_call_count = 0
         
         with st.spinner("Fetching videos..."):
             try:
                 # Initialize API
-                youtube_api = YouTubeAPI(api_key)
+                youtube_api = get_youtube_api(api_key)
+                start_call_count = youtube_api.get_api_call_count()
                 
                 # Handle channel input
-                if st.session_state.source_type == "channel" and channel_input:
+                if ss.source_type == "channel" and channel_input:
                     # Reset channel_id if the channel input has changed
-                    if channel_input != st.session_state.last_channel_input:
-                        st.session_state.channel_id = ""
-                        st.session_state.last_channel_input = channel_input
+                    if channel_input != ss.last_channel_input:
+                        ss.channel_id = ""
+                        ss.last_channel_input = channel_input
                 
                     # Get videos from channel using the alternative method
                     # Get the channel ID
@@ -657,7 +1140,7 @@ with st.sidebar:
                             raise e
                             
                     channel_id = channel_info["channel_id"]
-                    st.session_state.channel_id = channel_id
+                    ss.channel_id = channel_id
                     
                     # Console log the channel ID
                     print(f"Channel ID found: {channel_id}")
@@ -677,20 +1160,20 @@ with st.sidebar:
                     st.code(f"Channel ID: {channel_id}\nModified ID: {modified_id}", language="python")
                     
                     # Set up the state for playlist mode with the modified ID
-                    st.session_state.source_type = "playlist"
-                    st.session_state.playlist_id = modified_id
-                    st.session_state.last_playlist_input = modified_id
+                    ss.source_type = "playlist"
+                    ss.playlist_id = modified_id
+                    ss.last_playlist_input = modified_id
                     
                     # Create the direct URL for reference
                     direct_url = f"https://www.youtube.com/playlist?list={modified_id}"
                     st.info(f"Using modified channel ID as playlist: [Open in YouTube]({direct_url})")
                 
                 # Handle playlist input
-                elif st.session_state.source_type == "playlist" and playlist_input:
+                elif ss.source_type == "playlist" and playlist_input:
                     # Reset playlist_id if the playlist input has changed
-                    if playlist_input != st.session_state.last_playlist_input:
-                        st.session_state.playlist_id = playlist_input
-                        st.session_state.last_playlist_input = playlist_input
+                    if playlist_input != ss.last_playlist_input:
+                        ss.playlist_id = playlist_input
+                        ss.last_playlist_input = playlist_input
                     
                     # Get videos from playlist directly
                     try:
@@ -707,9 +1190,11 @@ with st.sidebar:
                             progress_bar.progress(progress_value)
                         
                         # Get videos from playlist with progress updates
-                        videos = youtube_api.get_videos_from_playlist(
-                            st.session_state.playlist_id,
-                            progress_callback=progress_callback
+                        videos = fetch_playlist_videos(
+                            ss.playlist_id,
+                            hash_api_key(api_key),
+                            youtube_api,
+                            progress_callback
                         )
                         
                         # Complete the progress bar
@@ -726,37 +1211,33 @@ with st.sidebar:
                     st.stop()
                 
                 # Store raw videos in session state
-                st.session_state.raw_videos = videos
+                ss.raw_videos_df = videos
+                ss.videos_key = videos_fingerprint(videos)
                 
                 # Store initial ranking parameters
-                st.session_state.like_weight = like_weight
-                st.session_state.view_weight = view_weight
-                st.session_state.half_life_days = half_life_days
+                ss.like_weight = like_weight
+                ss.view_weight = view_weight
+                ss.half_life_days = half_life_days
                 
                 # Calculate scores
-                st.session_state.videos_df = youtube_api.calculate_video_scores(
-                    videos, 
-                    like_weight=like_weight,
-                    view_weight=view_weight,
-                    half_life_days=half_life_days
+                ss.videos_df, ss.video_stats = score_videos(
+                    ss.videos_key,
+                    like_weight,
+                    view_weight,
+                    half_life_days,
+                    videos
                 )
                 
                 # Update API call counter
-                st.session_state.api_call_count = youtube_api.get_api_call_count()
-                st.session_state.total_api_call_count += st.session_state.api_call_count
+                ss.api_call_count = youtube_api.get_api_call_count() - start_call_count
+                ss.total_api_call_count += ss.api_call_count
                 
                 # Reset the confirmation dialog
-                st.session_state.show_confirmation = False
-                st.session_state.estimate_info = None
+                ss.show_confirmation = False
+                ss.estimate_info = None
                 
-                # Reset filter settings when new data is fetched
-                st.session_state.filter_settings = {
-                    "date_range": None,
-                    "duration_range": None,
-                    "views_range": None,
-                    "likes_range": None,
-                    "search_term": ""
-                }
+                # Reset filter settings to the new videos' bounds
+                reset_filters()
                 
                 st.success(f"Found {len(videos)} videos!")
                 
@@ -764,11 +1245,11 @@ with st.sidebar:
                 st.error(f"Error: {str(e)}")
     
     # Display API call counter
-    if st.session_state.api_call_count > 0:
+    if ss.api_call_count > 0:
         st.markdown(f"""
         <div class="api-counter">
-            <strong>API Calls:</strong> {st.session_state.api_call_count} (last run)<br>
-            <strong>Total API Calls:</strong> {st.session_state.total_api_call_count} (all runs)
+            <strong>API Calls:</strong> {ss.api_call_count} (last run)<br>
+            <strong>Total API Calls:</strong> {ss.total_api_call_count} (all runs)
         </div>
         """, unsafe_allow_html=True)
     
@@ -789,26 +1270,17 @@ if st.session_state.cache_loaded and st.session_state.selected_cache_id:
 
 # Also display API call counter in main interface when videos are displayed
 if st.session_state.videos_df is not None and not st.session_state.videos_df.empty:
-    df = st.session_state.videos_df.copy()
-    
-    # Add human-readable duration
-    df["duration_str"] = df["duration"].apply(parse_duration)
-    
-    # Add formatted view and like counts
-    df["view_count_str"] = df["view_count"].apply(format_number)
-    df["like_count_str"] = df["like_count"].apply(format_number)
-    
-    # Add duration in seconds for easier filtering
-    df["duration_seconds"] = df["duration_str"].apply(duration_to_seconds)
+    # Display columns are precomputed by score_videos, so no copy is needed here
+    df = st.session_state.videos_df
     
     # Display stats
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total Videos", len(df))
     with col2:
-        st.metric("Total Views", format_number(df["view_count"].sum()))
+        st.metric("Total Views", format_number(st.session_state.video_stats["total_views"]))
     with col3:
-        st.metric("Total Likes", format_number(df["like_count"].sum()))
+        st.metric("Total Likes", format_number(st.session_state.video_stats["total_likes"]))
     with col4:
         st.metric("API Calls", st.session_state.api_call_count)
     
@@ -834,9 +1306,10 @@ if st.session_state.videos_df is not None and not st.session_state.videos_df.emp
             }
             
             # Save to cache
-            if st.session_state.raw_videos:
+            if st.session_state.raw_videos_df is not None and not st.session_state.raw_videos_df.empty:
                 cache_id = save_to_cache(source_type, source_id, 
-                                       st.session_state.raw_videos, ranking_params, cache_label)
+                                       st.session_state.raw_videos_df, ranking_params, cache_label,
+                                       videos_key=st.session_state.videos_key)
                 st.success(f"Results saved to cache! (ID: {cache_id})")
                 
                 # Update selected cache ID
@@ -845,6 +1318,11 @@ if st.session_state.videos_df is not None and not st.session_state.videos_df.emp
     
     # Add ranking parameter controls to allow adjusting without refetching
     st.subheader("Adjust Ranking Parameters")
+    # Read the current parameters once for the slider defaults
+    current_like_weight = float(st.session_state.like_weight)
+    current_view_weight = float(st.session_state.view_weight)
+    current_half_life_days = int(st.session_state.half_life_days)
+    
     with st.form(key="ranking_form"):
         ranking_cols = st.columns(3)
         
@@ -852,7 +1330,7 @@ if st.session_state.videos_df is not None and not st.session_state.videos_df.emp
             like_weight = st.slider(
                 "Like Weight", 
                 0.1, 5.0, 
-                float(st.session_state.get('like_weight', 1.0)), 
+                current_like_weight, 
                 0.1,
                 key="like_weight"
             )
@@ -861,7 +1339,7 @@ if st.session_state.videos_df is not None and not st.session_state.videos_df.emp
             view_weight = st.slider(
                 "View Weight", 
                 0.01, 1.0, 
-                float(st.session_state.get('view_weight', 0.1)), 
+                current_view_weight, 
                 0.01,
                 key="view_weight"
             )
@@ -870,7 +1348,7 @@ if st.session_state.videos_df is not None and not st.session_state.videos_df.emp
             half_life_days = st.slider(
                 "Half-life (days)", 
                 7, 365, 
-                int(st.session_state.get('half_life_days', 90)), 
+                current_half_life_days, 
                 1,
                 key="half_life_days"
             )
@@ -879,8 +1357,7 @@ if st.session_state.videos_df is not None and not st.session_state.videos_df.emp
     
     # Display score components plot
     st.subheader("Score Components for Top Videos")
-    fig = plot_score_components(df)
-    st.pyplot(fig)
+    st.altair_chart(score_components_chart(df), use_container_width=True)
     
     # Display videos with enhanced filtering
     st.subheader("Ranked Videos")
@@ -890,147 +1367,115 @@ if st.session_state.videos_df is not None and not st.session_state.videos_df.emp
         st.markdown('<div class="filter-section">', unsafe_allow_html=True)
         st.markdown('<div class="filter-header">Filter Options</div>', unsafe_allow_html=True)
         
-        # Create multi-column layout for filters
-        filter_cols = st.columns(2)
-        
-        with filter_cols[0]:
-            # Date range filter
-            min_date = df["published_at"].min().date()
-            max_date = df["published_at"].max().date()
-            
-            date_range = st.date_input(
-                "Date Range",
-                value=st.session_state.filter_settings["date_range"] or (min_date, max_date),
-                min_value=min_date,
-                max_value=max_date
-            )
-            st.session_state.filter_settings["date_range"] = date_range
-            
-            # Duration filter
-            min_duration = int(df["duration_seconds"].min())
-            max_duration = int(df["duration_seconds"].max())
-            
-            # Format duration for display - for information only, not used in slider
-            def format_duration_display(seconds):
-                minutes, seconds = divmod(seconds, 60)
-                hours, minutes = divmod(minutes, 60)
-                if hours > 0:
-                    return f"{hours}h {minutes}m {seconds}s"
-                else:
-                    return f"{minutes}m {seconds}s"
-            
-            # Show duration range information above the slider
-            st.write(f"Duration range: {format_duration_display(min_duration)} to {format_duration_display(max_duration)}")
-            
-            # Use a standard slider with seconds as values
-            duration_range = st.slider(
-                "Duration (in seconds)",
-                min_value=min_duration,
-                max_value=max_duration,
-                value=st.session_state.filter_settings["duration_range"] or (min_duration, max_duration)
-            )
-            st.session_state.filter_settings["duration_range"] = duration_range
-            
-            # Display the selected duration range in a readable format
-            min_dur, max_dur = duration_range
-            st.write(f"Selected: {format_duration_display(min_dur)} to {format_duration_display(max_dur)}")
+        # Widget keys change with each reset; values default to the full bounds
+        filter_generation = st.session_state.filter_generation
         
-        with filter_cols[1]:
-            # Views filter
-            min_views = int(df["view_count"].min())
-            max_views = int(df["view_count"].max())
-            
-            views_range = st.slider(
-                "Views",
-                min_value=min_views,
-                max_value=max_views,
-                value=st.session_state.filter_settings["views_range"] or (min_views, max_views),
-                format="%d"
-            )
-            st.session_state.filter_settings["views_range"] = views_range
+        with st.form("filter_form"):
+            # Create multi-column layout for filters
+            filter_cols = st.columns(2)
             
-            # Display the selected views range in a formatted way
-            min_views_selected, max_views_selected = views_range
-            st.write(f"Selected: {format_number(min_views_selected)} to {format_number(max_views_selected)}")
+            with filter_cols[0]:
+                # Date range filter
+                min_date, max_date = st.session_state.video_stats["date_range"]
+                
+                date_range = st.date_input(
+                    "Date Range",
+                    value=(min_date, max_date),
+                    min_value=min_date,
+                    max_value=max_date,
+                    key=f"filter_date_range_{filter_generation}"
+                )
+                
+                # Duration filter
+                min_duration, max_duration = st.session_state.video_stats["duration_range"]
+                
+                # Show duration range information above the slider
+                st.write(f"Duration range: {format_duration_display(min_duration)} to {format_duration_display(max_duration)}")
+                
+                # Use a standard slider with seconds as values
+                duration_range = st.slider(
+                    "Duration (in seconds)",
+                    min_value=min_duration,
+                    max_value=max_duration,
+                    value=(min_duration, max_duration),
+                    key=f"filter_duration_range_{filter_generation}"
+                )
+                
+                # Display the selected duration range in a readable format
+                min_dur, max_dur = duration_range
+                st.write(f"Selected: {format_duration_display(min_dur)} to {format_duration_display(max_dur)}")
             
-            # Likes filter
-            min_likes = int(df["like_count"].min())
-            max_likes = int(df["like_count"].max())
+            with filter_cols[1]:
+                # Views filter
+                min_views, max_views = st.session_state.video_stats["views_range"]
+                
+                views_range = st.slider(
+                    "Views",
+                    min_value=min_views,
+                    max_value=max_views,
+                    value=(min_views, max_views),
+                    format="%d",
+                    key=f"filter_views_range_{filter_generation}"
+                )
+                
+                # Display the selected views range in a formatted way
+                min_views_selected, max_views_selected = views_range
+                st.write(f"Selected: {format_number(min_views_selected)} to {format_number(max_views_selected)}")
+                
+                # Likes filter
+                min_likes, max_likes = st.session_state.video_stats["likes_range"]
+                
+                likes_range = st.slider(
+                    "Likes",
+                    min_value=min_likes,
+                    max_value=max_likes,
+                    value=(min_likes, max_likes),
+                    format="%d",
+                    key=f"filter_likes_range_{filter_generation}"
+                )
+                
+                # Display the selected likes range in a formatted way
+                min_likes_selected, max_likes_selected = likes_range
+                st.write(f"Selected: {format_number(min_likes_selected)} to {format_number(max_likes_selected)}")
             
-            likes_range = st.slider(
-                "Likes",
-                min_value=min_likes,
-                max_value=max_likes,
-                value=st.session_state.filter_settings["likes_range"] or (min_likes, max_likes),
-                format="%d"
+            # Title search (full width)
+            search_term = st.text_input(
+                "Search in Title",
+                key=f"filter_search_term_{filter_generation}"
             )
-            st.session_state.filter_settings["likes_range"] = likes_range
             
-            # Display the selected likes range in a formatted way
-            min_likes_selected, max_likes_selected = likes_range
-            st.write(f"Selected: {format_number(min_likes_selected)} to {format_number(max_likes_selected)}")
-        
-        # Title search (full width)
-        search_term = st.text_input(
-            "Search in Title",
-            value=st.session_state.filter_settings["search_term"]
-        )
-        st.session_state.filter_settings["search_term"] = search_term
-        
-        # Reset filters button
-        if st.button("Reset All Filters"):
-            st.session_state.filter_settings = {
-                "date_range": (min_date, max_date),
-                "duration_range": (min_duration, max_duration),
-                "views_range": (min_views, max_views),
-                "likes_range": (min_likes, max_likes),
-                "search_term": ""
-            }
-            # Force refresh
-            st.rerun()
+            # Filters only take effect on submit, so typing or dragging doesn't rerun the app;
+            # reset's callback runs before the pass it triggers, so the new widgets are
+            # built in that same pass and no extra rerun is needed
+            submit_cols = st.columns(2)
+            with submit_cols[0]:
+                st.form_submit_button("Apply Filters")
+            with submit_cols[1]:
+                st.form_submit_button("Reset All Filters", on_click=reset_filters)
             
         st.markdown('</div>', unsafe_allow_html=True)
     
-    # Apply filters
-    filtered_df = df.copy()
-    
-    # Date filter
-    if len(date_range) == 2:
-        start_date, end_date = date_range
-        filtered_df = filtered_df[
-            (filtered_df["published_at"].dt.date >= start_date) &
-            (filtered_df["published_at"].dt.date <= end_date)
-        ]
-    
-    # Duration filter
-    if duration_range:
-        min_duration, max_duration = duration_range
-        filtered_df = filtered_df[
-            (filtered_df["duration_seconds"] >= min_duration) &
-            (filtered_df["duration_seconds"] <= max_duration)
-        ]
-    
-    # Views filter
-    if views_range:
-        min_views, max_views = views_range
-        filtered_df = filtered_df[
-            (filtered_df["view_count"] >= min_views) &
-            (filtered_df["view_count"] <= max_views)
-        ]
-    
-    # Likes filter
-    if likes_range:
-        min_likes, max_likes = likes_range
-        filtered_df = filtered_df[
-            (filtered_df["like_count"] >= min_likes) &
-            (filtered_df["like_count"] <= max_likes)
-        ]
+    # Re-filter only when the scored videos or a filter value changed since the last run;
+    # the scoring parameters are part of the key because they reorder the rows
+    scores_key = (
+        st.session_state.videos_key,
+        st.session_state.get('like_weight'),
+        st.session_state.get('view_weight'),
+        st.session_state.get('half_life_days')
+    )
+    filter_args = (tuple(date_range), tuple(duration_range), tuple(views_range), tuple(likes_range),
+                   search_term)
+    filter_key = (scores_key,) + filter_args
+    if filter_key != st.session_state.results_filter_key:
+        st.session_state.results_indices = filter_indices(
+            scores_key, *filter_args, df, st.session_state.video_stats
+        )
+        st.session_state.results_filter_key = filter_key
+        # Go back to the first page whenever the data or any filter changes
+        st.session_state.results_page = 1
     
-    # Title search
-    if search_term:
-        filtered_df = filtered_df[
-            filtered_df["title"].str.lower().str.contains(search_term.lower())
-        ]
+    results_indices = st.session_state.results_indices
+    filtered_df = df if results_indices is None else df.iloc[results_indices]
     
     # Display number of filtered videos and percentage
     filtered_percent = (len(filtered_df) / len(df) * 100) if len(df) > 0 else 0
@@ -1038,27 +1483,22 @@ if st.session_state.videos_df is not None and not st.session_state.videos_df.emp
     
     # Display videos in a grid
     if not filtered_df.empty:
-        cols = st.columns(3)
-        for i, (_, video) in enumerate(filtered_df.iterrows()):
-            col = cols[i % 3]
-            with col:
-                st.markdown(f"""
-                <div class="video-card">
-                    <a href="{video['url']}" target="_blank">
-                        <img src="{video['thumbnail']}" width="100%">
-                    </a>
-                    <div class="video-title">{video['title']}</div>
-                    <div class="video-stats">
-                        👁️ {video['view_count_str']} views &nbsp;|&nbsp; 
-                        👍 {video['like_count_str']} likes &nbsp;|&nbsp; 
-                        ⏱️ {video['duration_str']}
-                    </div>
-                    <div class="video-stats">
-                        📅 {video['published_at'].strftime('%Y-%m-%d')} &nbsp;|&nbsp; 
-                        <span class="video-score">Score: {video['score']:.2f}</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+        # Only render the current page of results
+        page_count = max(1, (len(filtered_df) + VIDEOS_PER_PAGE - 1) // VIDEOS_PER_PAGE)
+        page = min(max(st.session_state.results_page, 1), page_count)
+        st.session_state.results_page = page
+        page_df = filtered_df.iloc[(page - 1) * VIDEOS_PER_PAGE:page * VIDEOS_PER_PAGE]
+        
+        page_cols = st.columns([1, 2, 1])
+        with page_cols[0]:
+            st.button("◀ Previous", on_click=change_results_page, args=(-1,), disabled=page <= 1)
+        with page_cols[1]:
+            st.write(f"Page {page} of {page_count}")
+        with page_cols[2]:
+            st.button("Next ▶", on_click=change_results_page, args=(1,), disabled=page >= page_count)
+        
+        # Emit the whole page as a single CSS grid container of precomputed cards
+        st.markdown('<div class="video-grid">' + "".join(page_df["card_html"]) + '</div>', unsafe_allow_html=True)
     else:
         st.warning("No videos match your filter criteria. Try adjusting your filters.")
 else:
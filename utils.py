@@ -1,33 +1,28 @@
-import re
 import datetime
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
+import altair as alt
 
-def parse_duration(duration: str) -> str:
-    """Convert ISO 8601 duration format to human-readable format.
+def parse_duration_vec(durations: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Convert a Series of ISO 8601 durations to human-readable format.
     
     Args:
-        duration: ISO 8601 duration string (e.g., 'PT1H2M3S')
+        durations: Series of ISO 8601 duration strings (e.g., 'PT1H2M3S')
     
     Returns:
-        Human-readable duration string (e.g., '1:02:03')
+        Tuple of (human-readable duration strings such as '1:02:03', total seconds as int32),
+        both aligned with the input
     """
-    # Extract hours, minutes, seconds
-    hours_match = re.search(r'(\d+)H', duration)
-    minutes_match = re.search(r'(\d+)M', duration)
-    seconds_match = re.search(r'(\d+)S', duration)
-    
-    hours = int(hours_match.group(1)) if hours_match else 0
-    minutes = int(minutes_match.group(1)) if minutes_match else 0
-    seconds = int(seconds_match.group(1)) if seconds_match else 0
+    # Parse in C; day components (P1DT2H) roll into the hours
+    total = pd.to_timedelta(durations, errors="coerce").dt.total_seconds().fillna(0).astype("int32")
+    hours, minutes, seconds = total // 3600, total % 3600 // 60, total % 60
     
     # Format as HH:MM:SS or MM:SS
-    if hours > 0:
-        return f"{hours}:{minutes:02d}:{seconds:02d}"
-    else:
-        return f"{minutes}:{seconds:02d}"
+    seconds_str = seconds.astype(str).str.zfill(2)
+    long_format = hours.astype(str) + ":" + minutes.astype(str).str.zfill(2) + ":" + seconds_str
+    short_format = minutes.astype(str) + ":" + seconds_str
+    return long_format.where(hours > 0, short_format), total
 
 def format_number(num: int) -> str:
     """Format large numbers with K, M, B suffixes.
@@ -47,41 +42,70 @@ def format_number(num: int) -> str:
     else:
         return str(num)
 
-def plot_score_components(df: pd.DataFrame, top_n: int = 20) -> plt.Figure:
-    """Create a plot showing the components of the score for top videos.
+def format_duration_display(seconds: int) -> str:
+    """Format a number of seconds as a readable duration.
     
     Args:
-        df: DataFrame with video data and scores
-        top_n: Number of top videos to include
+        seconds: Duration in seconds
     
     Returns:
-        Matplotlib figure
+        Duration string (e.g., '1h 2m 3s', '4m 5s')
     """
-    # Get top N videos
-    top_df = df.head(top_n).copy()
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    else:
+        return f"{minutes}m {seconds}s"
+
+def format_number_vec(nums: pd.Series) -> pd.Series:
+    """Vectorized version of format_number for a whole Series.
     
-    # Create a figure
-    fig, ax = plt.subplots(figsize=(12, 8))
+    Args:
+        nums: Series of numbers to format
     
-    # Plot bars
-    x = np.arange(len(top_df))
-    width = 0.35
+    Returns:
+        Series of formatted strings, aligned with the input
+    """
+    values = nums.to_numpy(dtype=np.int64)
+    thresholds = [values >= 1_000_000_000, values >= 1_000_000, values >= 1_000]
+    divisors = np.select(thresholds, [1_000_000_000, 1_000_000, 1_000], default=1)
+    suffixes = np.select(thresholds, ["B", "M", "K"], default="")
+    
+    scaled = np.char.add(np.char.mod("%.1f", values / divisors), suffixes)
+    formatted = np.where(divisors > 1, scaled, values.astype(str))
+    return pd.Series(formatted, index=nums.index, dtype=object)
+
+def plot_score_components_altair(df: pd.DataFrame, top_n: int = 20) -> alt.Chart:
+    """Create an Altair chart showing the components of the score for top videos.
     
-    # Normalize scores for better visualization
-    max_score = top_df["score"].max()
-    top_df["normalized_score"] = top_df["score"] / max_score
+    Rendered by the browser from a Vega-Lite spec instead of rasterized server-side.
+    
+    Args:
+        df: DataFrame with video data and scores
+        top_n: Number of top videos to include
     
-    # Plot components
-    ax.bar(x, top_df["normalized_score"], width, label="Final Score")
-    ax.bar(x + width, top_df["time_decay_factor"], width, label="Time Decay Factor")
+    Returns:
+        Altair chart
+    """
+    # Get top N videos
+    top_df = df.head(top_n)
+    labels = [f"Video {i+1}" for i in range(len(top_df))]
     
-    # Add labels and title
-    ax.set_xlabel("Videos")
-    ax.set_ylabel("Normalized Score")
-    ax.set_title("Score Components for Top Videos")
-    ax.set_xticks(x + width / 2)
-    ax.set_xticklabels([f"Video {i+1}" for i in range(len(top_df))], rotation=45)
-    ax.legend()
+    # Long format: one row per (video, component); scores normalized for better visualization
+    chart_df = pd.DataFrame({
+        "video": labels * 2,
+        "component": ["Final Score"] * len(top_df) + ["Time Decay Factor"] * len(top_df),
+        "value": np.concatenate([
+            (top_df["score"] / top_df["score"].max()).to_numpy(dtype=float),
+            top_df["time_decay_factor"].to_numpy(dtype=float)
+        ])
+    })
     
-    plt.tight_layout()
-    return fig 
\ No newline at end of file
+    return alt.Chart(chart_df, title="Score Components for Top Videos").mark_bar().encode(
+        x=alt.X("video:N", sort=labels, title="Videos"),
+        xOffset="component:N",
+        y=alt.Y("value:Q", title="Normalized Score"),
+        color=alt.Color("component:N", title=None),
+        tooltip=["video:N", "component:N", alt.Tooltip("value:Q", format=".3f")]
+    )
@@ -1,9 +1,13 @@
 import os
+import re
 import datetime
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 import math
 
 import googleapiclient.discovery
+import googleapiclient.http
 from dotenv import load_dotenv
 import pandas as pd
 import numpy as np
@@ -12,15 +16,23 @@ from utils import format_number
 # Load environment variables
 load_dotenv()
 
+# Maximum number of independent API requests kept in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Channel URL formats: /channel/<id>, or /c/<custom>, /user/<name>, /@<handle>
+_CHANNEL_URL_RE = re.compile(
+    r'youtube\.com/(?:channel/(?P<cid>[^/?#]+)|(?:c/|user/|@)(?P<user>[^/?#]+))'
+)
+
 # Add this standalone function after the imports but before the class
-def calculate_video_scores(videos: List[Dict], 
+def calculate_video_scores(videos: Union[List[Dict], pd.DataFrame], 
                           like_weight: float = 1.0, 
                           view_weight: float = 0.1,
                           half_life_days: int = 90) -> pd.DataFrame:
     """Calculate scores for videos based on likes, views, and recency.
     
     Args:
-        videos: List of video data dictionaries
+        videos: DataFrame of video data (one row per video) or list of video data dictionaries
         like_weight: Weight for likes in the score calculation
         view_weight: Weight for views in the score calculation
         half_life_days: Number of days after which a video's score is halved
@@ -28,11 +40,11 @@ def calculate_video_scores(videos: List[Dict],
     Returns:
         DataFrame with videos and their scores, sorted by score in descending order
     """
-    if not videos:
+    if len(videos) == 0:
         return pd.DataFrame()
     
-    # Convert to DataFrame
-    df = pd.DataFrame(videos)
+    # Convert to DataFrame; copy a frame so the caller's raw columns stay untouched
+    df = videos.copy() if isinstance(videos, pd.DataFrame) else pd.DataFrame(videos)
     
     # Convert published_at to datetime
     df["published_at"] = pd.to_datetime(df["published_at"])
@@ -94,6 +106,32 @@ class YouTubeAPI:
         self.api_call_count += 1
         return request.execute()
     
+    def _execute_api_requests_concurrently(self, requests: List) -> List[Dict]:
+        """Execute independent API requests concurrently and increment the call counter.
+        
+        httplib2 connections are not thread-safe, so every worker thread gets
+        its own connection, reused for all requests that thread executes.
+        
+        Args:
+            requests: The request objects to execute
+            
+        Returns:
+            The responses from the API, in the same order as the requests
+        """
+        if len(requests) <= 1:
+            return [self._execute_api_request(request) for request in requests]
+        
+        self.api_call_count += len(requests)
+        thread_state = threading.local()
+        
+        def execute(request):
+            if not hasattr(thread_state, "http"):
+                thread_state.http = googleapiclient.http.build_http()
+            return request.execute(http=thread_state.http)
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(requests))) as executor:
+            return list(executor.map(execute, requests))
+    
     def estimate_channel_api_calls(self, channel_username: str) -> Dict:
         """Estimate the number of API calls needed for a channel.
         
@@ -242,25 +280,12 @@ class YouTubeAPI:
         if channel_username in self.cache["channel_info"]:
             return self.cache["channel_info"][channel_username]
             
-        # Handle URL formats first
-        if "youtube.com/" in channel_username or "youtu.be/" in channel_username:
-            # Handle YouTube URL formats
-            if "youtube.com/c/" in channel_username:
-                # Legacy custom URL format
-                username = channel_username.split("/c/")[-1].split("/")[0].split("?")[0]
-                channel_username = username
-            elif "youtube.com/@" in channel_username:
-                # Handle format - preserve the @ for forHandle parameter
-                username = channel_username.split("@")[-1].split("/")[0].split("?")[0]
-                channel_username = username  # Remove the @ since we'll use the forHandle parameter
-            elif "youtube.com/channel/" in channel_username:
-                # Direct channel ID format - extract and use directly
-                channel_id = channel_username.split("/channel/")[-1].split("/")[0].split("?")[0]
-                channel_username = channel_id
-            elif "youtube.com/user/" in channel_username:
-                # Legacy username format
-                username = channel_username.split("/user/")[-1].split("/")[0].split("?")[0]
-                channel_username = username
+        # Handle URL formats first - a single regex pass extracts either the
+        # channel ID or the custom URL / legacy username / handle (without the @,
+        # since we search by handle name below)
+        url_match = _CHANNEL_URL_RE.search(channel_username)
+        if url_match:
+            channel_username = url_match.group("cid") or url_match.group("user")
                 
         # Check if this is a handle (starts with @)
         is_handle = channel_username.startswith('@')
@@ -713,16 +738,17 @@ class YouTubeAPI:
         # Get details for uncached videos
         new_video_details = []
         if uncached_video_ids:
-            # YouTube API can only process up to 50 video IDs at a time
-            for i in range(0, len(uncached_video_ids), 50):
-                chunk = uncached_video_ids[i:i+50]
-                
-                request = self.youtube.videos().list(
+            # YouTube API can only process up to 50 video IDs at a time,
+            # so fetch the chunks concurrently
+            requests = [
+                self.youtube.videos().list(
                     part="snippet,statistics,contentDetails",
-                    id=",".join(chunk)
+                    id=",".join(uncached_video_ids[i:i+50])
                 )
-                response = self._execute_api_request(request)
-                
+                for i in range(0, len(uncached_video_ids), 50)
+            ]
+            
+            for response in self._execute_api_requests_concurrently(requests):
                 for item in response.get("items", []):
                     # Extract relevant information
                     video_data = {